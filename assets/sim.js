@@ -0,0 +1,30 @@
+// Clientside callbacks for solar_dashboard.py: start/stop and the 1 s
+// simulation tick never round-trip to the server. tick holds the panel model
+// itself; it feeds both graphs and the alert.
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    sim: {
+        toggle: function(start, stop, disabled) {
+            var changed_id = window.dash_clientside.callback_context.triggered_id;
+            if (changed_id === 'start-btn') {
+                return false;
+            } else if (changed_id === 'stop-btn') {
+                return true;
+            }
+            return disabled;
+        },
+
+        tick: function(n, irradiance, temp, dust, alert_class) {
+            var window_size = 60;  // points kept on each graph
+            var eff = 18 * (1 - 0.005 * (temp - 25) - 0.2 * dust);
+            eff = Math.max(0, Math.min(18, eff));
+            var power = irradiance * 1.6 * eff / 100000;  // kW
+            // The warning text is pre-rendered in alert-div; only its class flips
+            var new_class = eff < 14 ? 'alert-active' : 'alert-hidden';
+            return [
+                [{x: [[n]], y: [[eff]]}, [0], window_size],
+                [{x: [[n]], y: [[power]]}, [0], window_size],
+                new_class === alert_class ? window.dash_clientside.no_update : new_class
+            ];
+        }
+    }
+});
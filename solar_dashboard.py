@@ -1,22 +1,29 @@
 import dash
 from dash import dcc, html
-from dash.dependencies import Input, Output, State
-import pandas as pd
-import numpy as np
-import plotly.graph_objs as go
+from dash.dependencies import ClientsideFunction, Input, Output, State
 import dash_daq as daq
 
 # ----------------------
-# Simulation Logic
+# Figures
 # ----------------------
-def simulate_data(irradiance, temp, dust):
-    ideal_eff = 0.18
-    loss_temp = 0.005 * (temp - 25)
-    loss_dust = 0.2 * dust
-    eff = ideal_eff * (1 - loss_temp - loss_dust)
-    eff = np.clip(eff, 0, ideal_eff)
-    power = irradiance * 1.6 * eff / 1000  # kW
-    return eff * 100, power
+# Axis styling the default 'plotly' template used to supply; plain-dict
+# figures don't get the template, so it is spelled out here
+AXIS_STYLE = {'gridcolor': 'white', 'linecolor': 'white', 'zerolinecolor': 'white', 'zerolinewidth': 2,
+              'ticks': '', 'automargin': True}
+
+
+def make_figure(title, yaxis_title, name, color):
+    # Plain dict built once at import: skips graph_objs validation and leaves
+    # Dash nothing to convert when serving the layout; ticks only extendData
+    return {
+        'data': [{'type': 'scattergl', 'x': [], 'y': [], 'mode': 'lines+markers',
+                  'name': name, 'line': {'color': color}}],
+        'layout': {'paper_bgcolor': '#1e1e2f', 'plot_bgcolor': '#1e1e2f', 'font': {'color': 'white'},
+                   'title': {'text': title, 'x': 0.05}, 'hovermode': 'closest', 'hoverlabel': {'align': 'left'},
+                   'xaxis': dict(AXIS_STYLE, title={'text': 'Time', 'standoff': 15}),
+                   'yaxis': dict(AXIS_STYLE, title={'text': yaxis_title, 'standoff': 15}),
+                   'uirevision': name}
+    }
 
 # ----------------------
 # Initialize Dash App
@@ -45,72 +52,38 @@ app.layout = html.Div(style={'backgroundColor': '#1e1e2f', 'color': 'white', 'pa
     ]),
 
     html.Div([
-        dcc.Graph(id='efficiency-graph'),
-        dcc.Graph(id='power-graph')
+        dcc.Graph(id='efficiency-graph', figure=make_figure('Efficiency (%)', 'Efficiency', 'Efficiency', 'lime')),
+        dcc.Graph(id='power-graph', figure=make_figure('Power Output (kW)', 'Power', 'Power', 'orange'))
     ]),
 
-    html.Div(id='alert-div', style={'textAlign': 'center', 'fontSize': '20px', 'color': 'red', 'paddingTop': '10px'})
+    html.Div(html.Span('⚠️ هشدار: بازده سیستم به زیر 14٪ رسیده!'), id='alert-div', className='alert-hidden',
+             style={'textAlign': 'center', 'fontSize': '20px', 'color': 'red', 'paddingTop': '10px'})
 ])
 
-# ----------------------
-# App State
-# ----------------------
-data_store = {
-    "time": [],
-    "efficiency": [],
-    "power": []
-}
-
 # ----------------------
 # Callbacks
 # ----------------------
-@app.callback(
+app.clientside_callback(
+    ClientsideFunction(namespace='sim', function_name='toggle'),
     Output('interval', 'disabled'),
     [Input('start-btn', 'n_clicks'), Input('stop-btn', 'n_clicks')],
     [State('interval', 'disabled')]
 )
-def toggle_interval(start, stop, disabled):
-    changed_id = dash.callback_context.triggered_id
-    if changed_id == 'start-btn':
-        return False
-    elif changed_id == 'stop-btn':
-        return True
-    return disabled
 
 
-@app.callback(
-    [Output('efficiency-graph', 'figure'),
-     Output('power-graph', 'figure'),
-     Output('alert-div', 'children')],
+# The tick runs in the browser (assets/sim.js): it streams both graphs and
+# sets the alert from the simulated efficiency
+app.clientside_callback(
+    ClientsideFunction(namespace='sim', function_name='tick'),
+    [Output('efficiency-graph', 'extendData'),
+     Output('power-graph', 'extendData'),
+     Output('alert-div', 'className')],
     [Input('interval', 'n_intervals')],
     [State('irradiance-knob', 'value'),
      State('temp-knob', 'value'),
-     State('dust-knob', 'value')]
+     State('dust-knob', 'value'),
+     State('alert-div', 'className')]
 )
-def update_graph(n, irradiance, temp, dust):
-    efficiency, power = simulate_data(irradiance, temp, dust)
-
-    data_store['time'].append(n)
-    data_store['efficiency'].append(efficiency)
-    data_store['power'].append(power)
-
-    eff_fig = go.Figure()
-    eff_fig.add_trace(go.Scatter(x=data_store['time'], y=data_store['efficiency'],
-                                 mode='lines+markers', name='Efficiency', line=dict(color='lime')))
-    eff_fig.update_layout(paper_bgcolor='#1e1e2f', plot_bgcolor='#1e1e2f', font=dict(color='white'),
-                          title='Efficiency (%)', xaxis_title='Time', yaxis_title='Efficiency')
-
-    power_fig = go.Figure()
-    power_fig.add_trace(go.Scatter(x=data_store['time'], y=data_store['power'],
-                                   mode='lines+markers', name='Power', line=dict(color='orange')))
-    power_fig.update_layout(paper_bgcolor='#1e1e2f', plot_bgcolor='#1e1e2f', font=dict(color='white'),
-                            title='Power Output (kW)', xaxis_title='Time', yaxis_title='Power')
-
-    alert = ''
-    if efficiency < 14:
-        alert = '⚠️ هشدار: بازده سیستم به زیر 14٪ رسیده!'
-
-    return eff_fig, power_fig, alert
 
 # ----------------------
 # Run App